@@ -1,37 +1,97 @@
 
 
 import argparse
-import random
-
-def generate_fake_dataset(count: int, seq_len: int, anomaly_rate: float = 0.0):
-    x = []
-    y = []
-    start_index = 0
-    for _ in range(count):
-        i = start_index
-        seq = []
-        for _ in range(seq_len):
-            if random.random() < anomaly_rate:
-                seq.append(random.randint(0, seq_len))
-            else:
-                seq.append(i)
-            i = (i + 1) % seq_len
-        x.append(seq)
-        y.append((i + 1) % seq_len)
-        start_index = (start_index + 1) % seq_len
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _gen(count: int, seq_len: int, anomaly_rate: float, seed: int):
+        # Seeds numba's own generator, NumPy's global state is left alone
+        np.random.seed(seed)
+        x = np.empty((count, seq_len), np.int32)
+        y = np.empty(count, np.int32)
+        start_index = 0
+        for row in range(count):
+            i = start_index
+            for col in range(seq_len):
+                if np.random.random() < anomaly_rate:
+                    x[row, col] = np.random.randint(0, seq_len + 1)
+                else:
+                    x[row, col] = i
+                i = (i + 1) % seq_len
+            y[row] = (i + 1) % seq_len
+            start_index = (start_index + 1) % seq_len
+        return x, y
+
+    # Compile up front so the first real call is not charged for the JIT.
+    _gen(1, 1, 0.0, 0)
+else:
+    def _gen(count: int, seq_len: int, anomaly_rate: float, seed: int):
+        # Same per-cell loop on a local generator instead of NumPy's global one
+        rng = np.random.RandomState(seed)
+        x = np.empty((count, seq_len), np.int32)
+        y = np.empty(count, np.int32)
+        start_index = 0
+        for row in range(count):
+            i = start_index
+            for col in range(seq_len):
+                if rng.random_sample() < anomaly_rate:
+                    x[row, col] = rng.randint(0, seq_len + 1)
+                else:
+                    x[row, col] = i
+                i = (i + 1) % seq_len
+            y[row] = (i + 1) % seq_len
+            start_index = (start_index + 1) % seq_len
+        return x, y
+
+# Cells generated per step, bounds the temporary arrays for large datasets
+_CHUNK_CELLS = 1 << 20
+
+def generate_fake_dataset(count: int, seq_len: int, anomaly_rate: float = 0.0, memmap_path: str | None = None, seed=None):
+    rng = np.random.default_rng(seed)
+    if memmap_path is None:
+        x = np.empty((count, seq_len), np.int32)
+    else:
+        # Rows are written straight to disk so x never has to fit in memory
+        x = np.memmap(memmap_path, dtype=np.int32, mode='w+', shape=(count, seq_len))
+    chunk_rows = max(1, _CHUNK_CELLS // max(1, seq_len))
+    for start in range(0, count, chunk_rows):
+        rows = np.arange(start, min(start + chunk_rows, count))
+        chunk = (np.add.outer(rows, np.arange(seq_len)) % seq_len).astype(np.int32)
+        mask = rng.random(chunk.shape, dtype=np.float32) < anomaly_rate
+        chunk[mask] = rng.integers(0, seq_len + 1, size=int(mask.sum()), dtype=np.int32)
+        x[start:start + len(rows)] = chunk
+    if memmap_path is not None:
+        x.flush()
+    y = ((np.arange(count) + 1) % seq_len).astype(np.int32)
     return x, y
 
+def generate_fake_dataset_per_cell(count: int, seq_len: int, anomaly_rate: float = 0.0, seed: int | None = None):
+    if seed is None:
+        seed = int(np.random.default_rng().integers(2**32))
+    return _gen(count, seq_len, anomaly_rate, seed)
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate fake data for testing')
     parser.add_argument("--count", "-c", type=int, default=10, help="Number of fake data to generate")
     parser.add_argument("--seq-len", "-s", type=int, default=10, help="Length of each sequence")
     parser.add_argument("--anomaly-rate", "-a", type=float, default=0.1, help="Rate of anomalies in the data")
+    parser.add_argument("--per-cell", action="store_true", help="Use the per-cell generator")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible data")
 
     args = parser.parse_args()
 
     print("Generating", args.count, "fake data")
 
-    x, y = generate_fake_dataset(args.count, 10, args.anomaly_rate)
+    if args.per_cell:
+        x, y = generate_fake_dataset_per_cell(args.count, 10, args.anomaly_rate, seed=args.seed)
+    else:
+        x, y = generate_fake_dataset(args.count, 10, args.anomaly_rate, seed=args.seed)
 
     print("x:", x)
     print("y:", y)
@@ -4,16 +4,26 @@ Generate synthetic log lines without angle bracket tags, using a cyclical order.
 """
 
 import argparse
-import random
+import numpy as np
 import string
 import requests
+from requests.adapters import HTTPAdapter
 import gzip
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
-from datetime import datetime, timedelta
+from operator import attrgetter
+from datetime import datetime
 from logentry import LogEntry, LogLevel, Property
 
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
 # Possible log levels and their relative frequencies.
 LOGLEVELS = ["DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"]
+LOGLEVEL_WEIGHTS = [0.05, 0.5, 0.3, 0.1, 0.05]
 
 # Entities and their corresponding actions.
 ENTITY_TYPES = [
@@ -50,7 +60,6 @@ ACTIONS = {
 
 # Miscellaneous data sources for placeholders.
 STATUS_CODES = [200, 201, 400, 401, 403, 404, 500, 502, 503]
-EMAIL_DOMAINS = ["example.com", "mail.com", "test.org", "sample.net"]
 SERVICE_NAMES = ["AuthService", "DataService",
 	"PaymentService", "NotificationService"]
 DEVICE_NAMES = ["DeviceA", "DeviceB", "SensorX", "SensorY"]
@@ -60,243 +69,264 @@ WEBHOOK_SOURCES = ["GitHub", "Stripe", "Slack", "Twilio"]
 LICENSE_TYPES = ["Pro", "Enterprise", "Basic", "Premium"]
 REPORT_TYPES = ["Sales", "Inventory", "UserActivity", "Performance"]
 
-# Functions to generate various random IDs.
-
-
-def generate_session_id():
-	return ''.join(random.choices(string.ascii_letters + string.digits, k=12))
-
-
-def generate_transaction_id():
-	return ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
-
-
-def generate_task_id():
-	return ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-
-
-def generate_deployment_id():
-	return 'deploy-' + ''.join(random.choices(string.digits, k=6))
-
-
-def generate_license_id():
-	return 'lic-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-
+# Generators for various random IDs.
 
-def generate_analytics_event_id():
-	return 'evt-' + ''.join(random.choices(string.ascii_lowercase + string.digits, k=10))
 
+class RandomIds:
+	"""
+	Callable returning random IDs drawn from `alphabet` with the generator `rng`.
+	IDs are drawn in batches with a single NumPy call and handed out one by one.
+	When `max_length` is set each ID has a random length in [length, max_length].
+	"""
 
-def generate_report_id():
-	return 'rep-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=7))
-
-
-def generate_payment_id():
-	return 'pay-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=9))
-
+	def __init__(self, rng, alphabet, length, prefix="", max_length=None, batch_size=4096):
+		self.rng = rng
+		self.alphabet = np.frombuffer(alphabet.encode("ascii"), np.uint8)
+		self.length = length
+		self.max_length = max_length
+		self.prefix = prefix
+		self.batch_size = batch_size
+		self.ids = []
+
+	def refill(self):
+		width = self.max_length or self.length
+		idx = self.rng.integers(0, len(self.alphabet), size=(self.batch_size, width))
+		text = self.alphabet[idx].tobytes().decode("ascii")
+		if self.max_length is None:
+			lengths = [width] * self.batch_size
+		else:
+			lengths = self.rng.integers(self.length, self.max_length, size=self.batch_size, endpoint=True).tolist()
+		prefix = self.prefix
+		self.ids = [prefix + text[i * width:i * width + n] for i, n in enumerate(lengths)]
 
-def random_string_name():
-	"""Generate a random name-like string."""
-	return ''.join(random.choices(string.ascii_letters, k=random.randint(5, 10)))
+	def __call__(self):
+		if not self.ids:
+			self.refill()
+		return self.ids.pop()
 
 
-def random_email():
-	"""Generate a random email address."""
-	return f"{''.join(random.choices(string.ascii_lowercase, k=7))}@{random.choice(EMAIL_DOMAINS)}"
+class RandomChoice:
+	"""
+	Callable returning random picks from `options` with the generator `rng`.
+	Picks are drawn in batches with a single NumPy call and handed out one by one.
+	"""
 
+	def __init__(self, rng, options, batch_size=4096):
+		self.rng = rng
+		self.options = [str(option) for option in options]
+		self.batch_size = batch_size
+		self.picks = []
+
+	def refill(self):
+		idx = self.rng.integers(0, len(self.options), size=self.batch_size).tolist()
+		options = self.options
+		self.picks = [options[i] for i in idx]
+
+	def __call__(self):
+		if not self.picks:
+			self.refill()
+		return self.picks.pop()
+
+
+class RandomPools:
+	"""Every random ID, name and pick used by the formatters, all drawn from `rng`."""
+
+	def __init__(self, rng, batch_size=4096):
+		letters_digits = string.ascii_letters + string.digits
+		upper_digits = string.ascii_uppercase + string.digits
+		lower_digits = string.ascii_lowercase + string.digits
+		self.session_id = RandomIds(rng, letters_digits, 12, batch_size=batch_size)
+		self.transaction_id = RandomIds(rng, upper_digits, 10, batch_size=batch_size)
+		self.task_id = RandomIds(rng, lower_digits, 8, batch_size=batch_size)
+		self.deployment_id = RandomIds(rng, string.digits, 6, prefix="deploy-", batch_size=batch_size)
+		self.license_id = RandomIds(rng, upper_digits, 8, prefix="lic-", batch_size=batch_size)
+		self.analytics_event_id = RandomIds(rng, lower_digits, 10, prefix="evt-", batch_size=batch_size)
+		self.report_id = RandomIds(rng, upper_digits, 7, prefix="rep-", batch_size=batch_size)
+		self.payment_id = RandomIds(rng, upper_digits, 9, prefix="pay-", batch_size=batch_size)
+		self.notification_id = RandomIds(rng, letters_digits, 8, batch_size=batch_size)
+		self.generic_id = RandomIds(rng, letters_digits, 8, batch_size=batch_size)
+		# Random name-like string.
+		self.user_name = RandomIds(rng, string.ascii_letters, 5, max_length=10, batch_size=batch_size)
+		self.api_name = RandomChoice(rng, API_NAMES, batch_size)
+		self.service_name = RandomChoice(rng, SERVICE_NAMES, batch_size)
+		self.device_name = RandomChoice(rng, DEVICE_NAMES, batch_size)
+		self.database_name = RandomChoice(rng, DATABASE_NAMES, batch_size)
+		self.webhook_source = RandomChoice(rng, WEBHOOK_SOURCES, batch_size)
+		self.status_code = RandomChoice(rng, STATUS_CODES, batch_size)
+
+
+# RandomPools attribute of the identifier shown after the entity name.
+# Entities not listed here (like "instance", "backup", etc.) get a generic ID.
+ENTITY_IDS = {
+	"user": "user_name",
+	"api request": "api_name",
+	"service": "service_name",
+	"device": "device_name",
+	"database": "database_name",
+	"notification": "notification_id",
+	"deployment": "deployment_id",
+	"license": "license_id",
+	"analytics event": "analytics_event_id",
+	"report": "report_id",
+	"payment": "payment_id",
+	"transaction": "transaction_id",
+	"task": "task_id",
+	"session": "session_id",
+}
 
-def random_timestamp(base_time):
-	"""Generate a random timestamp close to base_time in ISO format."""
-	offset_seconds = random.randint(0, 100000)
-	ts = (base_time + timedelta(seconds=offset_seconds)).isoformat()
-	return ts
+# Actions containing this marker are followed by a random user name.
+USER_SUFFIX_MARKERS = {
+	"notification": "user",
+	"deployment": "by user",
+	"license": "for user",
+	"analytics event": "for user",
+	"report": "for user",
+	"payment": "by user",
+	"session": "for user",
+}
 
 
-def generate_log_line(order, base_time):
+def build_formatter(entity, action):
 	"""
-	Generate a single log line without angle-bracket tags.
-	`order` cycles 1 -> 2 -> 3.
+	Build the formatter for one (entity, action) pair.
+	The pattern is: {timestamp} {loglevel} {entity} [entity_identifier] {action} [extra details]
 	"""
-	# Pick a loglevel, entity, and action.
-	loglevel = random.choices(LOGLEVELS, weights=[5, 50, 30, 10, 5])[0]
-	entity = random.choice(ENTITY_TYPES)
-	action = random.choice(ACTIONS[entity])
-
-	# Generate placeholders.
-	placeholders = {}
-	placeholders["loglevel"] = loglevel
-	placeholders["entity"] = entity
-	placeholders["action"] = action
-	placeholders["timestamp"] = random_timestamp(base_time)
-
-	# Decide how to fill in entity-specific fields/IDs.
-	if entity == "api request":
-		# e.g.: "returned status 404"
-		placeholders["api_name"] = random.choice(API_NAMES)
-		placeholders["status_code"] = str(random.choice(STATUS_CODES))
-	elif entity == "service":
-		placeholders["service_name"] = random.choice(SERVICE_NAMES)
-	elif entity == "device":
-		placeholders["device_name"] = random.choice(DEVICE_NAMES)
-	elif entity == "webhook":
-		placeholders["webhook_source"] = random.choice(WEBHOOK_SOURCES)
-	elif entity == "database":
-		placeholders["database_name"] = random.choice(DATABASE_NAMES)
-	elif entity == "notification":
-		placeholders["notification_id"] = ''.join(
-			random.choices(string.ascii_letters + string.digits, k=8))
-	elif entity == "deployment":
-		placeholders["deployment_id"] = generate_deployment_id()
-	elif entity == "license":
-		placeholders["license_id"] = generate_license_id()
-	elif entity == "analytics event":
-		placeholders["analytics_event_id"] = generate_analytics_event_id()
-	elif entity == "report":
-		placeholders["report_id"] = generate_report_id()
-	elif entity == "payment":
-		placeholders["payment_id"] = generate_payment_id()
-	elif entity == "transaction":
-		placeholders["transaction_id"] = generate_transaction_id()
-	elif entity == "task":
-		placeholders["task_id"] = generate_task_id()
-	elif entity == "session":
-		placeholders["session_id"] = generate_session_id()
-	elif entity == "user":
-		placeholders["user_name"] = random_string_name()
-		placeholders["user_email"] = random_email()
-
-	# Fallback for ID-based entities (like "instance", "backup", etc.) if needed.
-	# If no special ID, generate a generic one:
-	if entity not in ["user", "service", "device", "api request", "webhook", "database",
-					  "notification", "deployment", "license", "analytics event", "report",
-					  "payment", "transaction", "task", "session"]:
-		placeholders["generic_id"] = ''.join(
-			random.choices(string.ascii_letters + string.digits, k=8))
-
-	# Construct the log line string without angle brackets.
-	# We'll incorporate `order` for sequence, but without `<ORDER: x>`.
-
-	# Examples of final formatting:
-	#   INFO user JohnDoe registered at 2025-01-06 12:34:56, order=1
-	#   WARN api request UpdateProfile returned status 404 at 2025-01-06 12:34:56, order=2
-
-	# The pattern is: {loglevel} {entity} [entity_identifier] {action} [extra details?] at {timestamp}
-	# We'll tailor the [entity_identifier] and [extra details] based on the entity + action.
-
-	if entity == "user":
-		line = f"{placeholders['timestamp']} {loglevel} {
-			entity} {placeholders['user_name']} {action}"
-	elif entity == "api request":
-		if action == "returned status":
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['api_name']} returned status {placeholders['status_code']}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['api_name']} {action}"
-	elif entity == "service":
-		line = f"{placeholders['timestamp']} {loglevel} {
-			entity} {placeholders['service_name']} {action}"
-	elif entity == "device":
-		line = f"{placeholders['timestamp']} {loglevel} {
-			entity} {placeholders['device_name']} {action}"
-	elif entity == "webhook":
+	if entity == "webhook":
 		if action == "received from":
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {action} {placeholders['webhook_source']}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {action}"
-	elif entity == "database":
-		line = f"{placeholders['timestamp']} {loglevel} {
-			entity} {placeholders['database_name']} {action}"
-	elif entity == "notification":
-		if "user" in action:
-			user_for_notification = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['notification_id']} {action} {user_for_notification}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['notification_id']} {action}"
-	elif entity == "deployment":
-		if "by user" in action:
-			random_user = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['deployment_id']} {action} {random_user}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['deployment_id']} {action}"
-	elif entity == "license":
-		if "for user" in action:
-			random_user = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['license_id']} {action} {random_user}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['license_id']} {action}"
-	elif entity == "analytics event":
-		if "for user" in action:
-			random_user = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['analytics_event_id']} {action} {random_user}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['analytics_event_id']} {action}"
-	elif entity == "report":
-		if "for user" in action:
-			random_user = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['report_id']} {action} {random_user}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['report_id']} {action}"
-	elif entity == "payment":
-		if "by user" in action:
-			random_user = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['payment_id']} {action} {random_user}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['payment_id']} {action}"
-	elif entity == "transaction":
-		line = f"{placeholders['timestamp']} {loglevel} {
-			entity} {placeholders['transaction_id']} {action}"
-	elif entity == "task":
-		line = f"{placeholders['timestamp']} {loglevel} {
-			entity} {placeholders['task_id']} {action}"
-	elif entity == "session":
-		if "for user" in action:
-			random_user = random_string_name()
-			line = f"{placeholders['timestamp']} {loglevel} {entity} {
-				placeholders['session_id']} {action} {random_user}"
-		else:
-			line = f"{placeholders['timestamp']} {loglevel} {
-				entity} {placeholders['session_id']} {action}"
-	else:
-		generic_id = placeholders.get("generic_id", "")
-		line = f"{placeholders['timestamp']} {
-			loglevel} {entity} {generic_id} {action}"
+			return lambda ts, lv, pools: f"{ts} {lv} {entity} {action} {pools.webhook_source()}"
+		return lambda ts, lv, pools: f"{ts} {lv} {entity} {action}"
+
+	id_pool = attrgetter(ENTITY_IDS.get(entity, "generic_id"))
+	if entity == "api request" and action == "returned status":
+		return lambda ts, lv, pools: f"{ts} {lv} {entity} {id_pool(pools)()} {action} {pools.status_code()}"
+	marker = USER_SUFFIX_MARKERS.get(entity)
+	if marker is not None and marker in action:
+		return lambda ts, lv, pools: f"{ts} {lv} {entity} {id_pool(pools)()} {action} {pools.user_name()}"
+	return lambda ts, lv, pools: f"{ts} {lv} {entity} {id_pool(pools)()} {action}"
+
+
+# Formatters are resolved once at import so no per-line branching is needed.
+FORMATTERS = {
+	(entity, action): build_formatter(entity, action)
+	for entity in ENTITY_TYPES
+	for action in ACTIONS[entity]
+}
 
-	return line
+# The same formatters indexed by [entity index][action index], so batched
+# generation can pick one by position without building string keys.
+FORMATTER_TABLE = [
+	tuple(FORMATTERS[(entity, action)] for action in ACTIONS[entity])
+	for entity in ENTITY_TYPES
+]
+ACTION_COUNTS = np.array([len(formatters) for formatters in FORMATTER_TABLE])
 
 
-def generate_logs(total_logs):
-	"""Generate `total_logs` lines, cycling order from 1 to 2 to 3."""
-	logs = []
-	base_time = datetime.now()
-	for i in range(1, total_logs + 1):
-		order = (i % 3) + 1  # cycles through 1, 2, 3
-		line = generate_log_line(order, base_time)
-		logs.append(line)
-	return logs
+def generate_logs(total_logs, rng=None, base_time=None):
+	"""
+	Generate `total_logs` lines, drawing the per-line choices in bulk.
+	Everything random in the output, IDs included, comes from `rng`.
+	Timestamps fall within ~28 hours after `base_time`, a numpy datetime64.
+	"""
+	if rng is None:
+		rng = np.random.default_rng()
+	if base_time is None:
+		base_time = np.datetime64(datetime.now(), "us")
+	pools = RandomPools(rng, batch_size=max(1, min(4096, total_logs)))
+	lvl_idx = rng.choice(len(LOGLEVELS), size=total_logs, p=LOGLEVEL_WEIGHTS).tolist()
+	ent_idx = rng.integers(0, len(ENTITY_TYPES), size=total_logs)
+	# Scale a uniform draw by each line's own action count.
+	act_idx = (rng.random(total_logs) * ACTION_COUNTS[ent_idx]).astype(np.intp).tolist()
+	ent_idx = ent_idx.tolist()
+	ts_offsets = rng.integers(0, 100000, size=total_logs, endpoint=True)
+	# Format all timestamps in one vectorized call, same ISO format as datetime.isoformat.
+	timestamps = np.datetime_as_string(base_time + ts_offsets.astype("timedelta64[s]")).tolist()
+
+	return [
+		FORMATTER_TABLE[ent][act](timestamp, LOGLEVELS[lvl], pools)
+		for lvl, ent, act, timestamp in zip(lvl_idx, ent_idx, act_idx, timestamps)
+	]
+
+
+def generate_shard(shard):
+	"""
+	Generate one `(seed, count, base_time)` shard of log lines as a newline-terminated UTF-8 batch.
+	`seed` is a numpy SeedSequence.
+	"""
+	seed, count, base_time = shard
+	lines = generate_logs(count, np.random.default_rng(seed), base_time)
+	return ("\n".join(lines) + "\n").encode("utf-8")
 
 
-def upload_in_chunks(address, data, chunk_size=1024):
+def generate_log_chunks(total_logs, chunk_size=8192, workers=1, seed=None):
+	"""
+	Yield `total_logs` lines in batches of `chunk_size` lines.
+	With more than one worker the batches are generated in a process pool.
+	The same `seed` gives the same lines regardless of the number of workers.
+	"""
+	# One timestamp base for the whole run, shared by every shard and worker.
+	base_time = np.datetime64(datetime.now(), "us")
+	starts = range(0, total_logs, chunk_size)
+	shard_seeds = np.random.SeedSequence(seed).spawn(len(starts))
+	shards = [
+		(shard_seed, min(chunk_size, total_logs - start), base_time)
+		for shard_seed, start in zip(shard_seeds, starts)
+	]
+	if workers <= 1:
+		yield from map(generate_shard, shards)
+		return
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		# Keep a bounded number of batches in flight so memory stays flat
+		# when the consumer is slower than the workers.
+		pending = deque()
+		for shard in shards:
+			pending.append(executor.submit(generate_shard, shard))
+			if len(pending) > 2 * workers:
+				yield pending.popleft().result()
+		while pending:
+			yield pending.popleft().result()
+
+
+def gzip_stream(chunks):
+	"""Compress `chunks` with gzip, yielding compressed data as it becomes available."""
+	buf = BytesIO()
+	with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+		for chunk in chunks:
+			f.write(chunk)
+			if buf.tell():
+				yield buf.getvalue()
+				buf.seek(0)
+				buf.truncate()
+	# Closing the file writes the remaining data and the gzip trailer.
+	yield buf.getvalue()
+
+
+def zstd_stream(chunks):
+	"""Compress `chunks` with zstd, yielding compressed data as it becomes available."""
+	compressor = zstandard.ZstdCompressor().compressobj()
+	for chunk in chunks:
+		data = compressor.compress(chunk)
+		if data:
+			yield data
+	yield compressor.flush()
+
+
+def create_session(pool_size=1):
+	"""Create a session that keeps up to `pool_size` connections alive per host."""
+	session = requests.Session()
+	adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+	session.mount("http://", adapter)
+	session.mount("https://", adapter)
+	return session
+
+
+def upload_in_chunks(session, address, data, chunk_size=1024):
 	"""Upload data to the server in chunks."""
-	with requests.Session() as session:
-		headers = {"Transfer-Encoding": "chunked"}
-		response = session.post(
-			address, data=chunked_data_generator(data, chunk_size), headers=headers
-		)
-		return response
+	headers = {"Transfer-Encoding": "chunked"}
+	response = session.post(
+		address, data=chunked_data_generator(data, chunk_size), headers=headers
+	)
+	return response
 
 
 def chunked_data_generator(data, chunk_size):
@@ -318,6 +348,14 @@ def main():
 		"--count", "-c", type=int, default=1000,
 		help="Number of log lines to generate (default: 1000)"
 	)
+	parser.add_argument(
+		"--workers", "-w", type=int, default=1,
+		help="Number of processes generating log lines (default: 1)"
+	)
+	parser.add_argument(
+		"--seed", "-s", type=int, default=None,
+		help="Seed for reproducible log lines (default: random)"
+	)
 	# parser.add_argument(
 	#     "--output", "-o", type=str, default="generated_logs.txt",
 	#     help="Output file to store generated logs (default: generated_logs.txt)"
@@ -328,6 +366,10 @@ def main():
 		"address", type=str,
 		help="Server URL to upload raw logdata (example: http://localhost:8080)"
 	)
+	rawupload.add_argument(
+		"--compression", choices=["gzip", "zstd"], default="gzip",
+		help="Content encoding of the upload, zstd requires the zstandard package (default: gzip)"
+	)
 	rawstream = subparsers.add_parser("rawstream")
 	rawstream.add_argument(
 		"address", type=str,
@@ -339,35 +381,39 @@ def main():
 		help="Server URL to upload logdata (example: http://localhost:8080)"
 	)
 	args = parser.parse_args()
+	# Checked up front, a missing package inside the body generator would
+	# only surface after the request headers are already sent.
+	if args.command == "rawupload" and args.compression == "zstd" and zstandard is None:
+		parser.error("--compression zstd requires the zstandard package")
 
 	print(args)
 
-	logs_str = "\n".join(generate_logs(args.count))
-
-	if args.command == "rawupload":
-		print(f"Uploading raw log data to {args.address}...")
-
-		# Compress the log data
-		buf = BytesIO()
-		with gzip.GzipFile(fileobj=buf, mode='wb') as f:
-			f.write(logs_str.encode('utf-8'))
-		
-		compressed_data = buf.getvalue()
-		
-		# Send the compressed data
-		headers = {
-			#"Content-Encoding": "gzip",
-		}
-		res = requests.post(args.address, data=logs_str, headers=headers)
-		
-		print(res.status_code)
-	if args.command == "rawstream":
-		print(f"Streaming raw log data to {args.address}...")
-		upload_in_chunks(args.address, logs_str)
-	if args.command == "upload":
-		print(f"Uploading log data to {args.address}...")
-		res = requests.post(args.address, data=logs_str)
-		print(res.status_code)
+	# One session for the whole run so connections (and TLS) are reused.
+	with create_session(max(1, args.workers)) as session:
+		if args.command == "rawupload":
+			print(f"Uploading raw log data to {args.address}...")
+
+			# Compress while generating so the whole corpus is never held in memory.
+			chunks = generate_log_chunks(args.count, workers=args.workers, seed=args.seed)
+			if args.compression == "zstd":
+				body = zstd_stream(chunks)
+			else:
+				body = gzip_stream(chunks)
+			headers = {
+				"Content-Encoding": args.compression,
+			}
+			res = session.post(args.address, data=body, headers=headers)
+
+			print(res.status_code)
+		if args.command == "rawstream":
+			print(f"Streaming raw log data to {args.address}...")
+			logs_str = b"".join(generate_log_chunks(args.count, workers=args.workers, seed=args.seed)).decode("utf-8")
+			upload_in_chunks(session, args.address, logs_str)
+		if args.command == "upload":
+			print(f"Uploading log data to {args.address}...")
+			logs_str = b"".join(generate_log_chunks(args.count, workers=args.workers, seed=args.seed)).decode("utf-8")
+			res = session.post(args.address, data=logs_str)
+			print(res.status_code)
 
 if __name__ == "__main__":
 	main()
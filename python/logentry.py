@@ -3,35 +3,57 @@ from typing import List, Dict
 import struct
 import time
 
+_U8 = struct.Struct('B')
+_HEADER = struct.Struct('=QBB')
+_MSG_LEN = struct.Struct('=I')
+
+# Indexed by LogLevel value
+_LEVEL_NAMES = ("Debug", "Info", "Warning", "Error")
+
+def _read_u8(data: bytes, offset: int) -> int:
+    # Single length bytes are read by indexing, cheaper than struct.unpack_from
+    if offset >= len(data):
+        raise struct.error(f'unpack requires 1 byte at offset {offset}, buffer is {len(data)} bytes')
+    return data[offset]
+
+def _read_str(data: bytes, offset: int, length: int) -> str:
+    # Slicing clamps at the end of the buffer, so check bounds explicitly
+    # to reject truncated input like struct.unpack_from does
+    end = offset + length
+    if end > len(data):
+        raise struct.error(f'unpack requires {length} bytes at offset {offset}, buffer is {len(data)} bytes')
+    return str(data[offset:end], 'utf-8')
+
 @dataclass
 class Property:
     key: str
     value: str
     
     def pack(self) -> bytes:
+        buf = bytearray()
+        self.pack_into(buf)
+        return bytes(buf)
+
+    def pack_into(self, buf: bytearray) -> None:
         key_bytes = self.key.encode('utf-8')
         value_bytes = self.value.encode('utf-8')
-        
-        return struct.pack(
-            f'B{len(key_bytes)}sB{len(value_bytes)}s',
-            len(key_bytes),
-            key_bytes,
-            len(value_bytes),
-            value_bytes
-        )
+        buf += _U8.pack(len(key_bytes))
+        buf += key_bytes
+        buf += _U8.pack(len(value_bytes))
+        buf += value_bytes
     
     @classmethod
     def unpack(cls, data: bytes, offset: int = 0) -> tuple['Property', int]:
-        key_len = struct.unpack_from('B', data, offset)[0]
+        key_len = _read_u8(data, offset)
         offset += 1
         
-        key = struct.unpack_from(f'{key_len}s', data, offset)[0].decode('utf-8')
+        key = _read_str(data, offset, key_len)
         offset += key_len
         
-        val_len = struct.unpack_from('B', data, offset)[0]
+        val_len = _read_u8(data, offset)
         offset += 1
         
-        value = struct.unpack_from(f'{val_len}s', data, offset)[0].decode('utf-8')
+        value = _read_str(data, offset, val_len)
         offset += val_len
         
         return cls(key, value), offset
@@ -44,12 +66,9 @@ class LogLevel:
     
     @classmethod
     def to_string(cls, level: int) -> str:
-        return {
-            cls.DEBUG: "Debug",
-            cls.INFO: "Info", 
-            cls.WARNING: "Warning",
-            cls.ERROR: "Error"
-        }.get(level, "Unknown")
+        if 0 <= level < len(_LEVEL_NAMES):
+            return _LEVEL_NAMES[level]
+        return "Unknown"
 
 @dataclass
 class LogEntry:
@@ -59,26 +78,29 @@ class LogEntry:
     message: str
     
     def pack(self) -> bytes:
-        props_bytes = b''.join(prop.pack() for prop in self.properties)
+        buf = bytearray()
+        self.pack_into(buf)
+        return bytes(buf)
+
+    def pack_into(self, buf: bytearray) -> None:
+        # Append to the caller's buffer so batches of entries share one allocation
+        buf += _HEADER.pack(self.timestamp, self.level, len(self.properties))
+        for prop in self.properties:
+            prop.pack_into(buf)
+
         msg_bytes = self.message.encode('utf-8')
-        
-        return struct.pack(
-            f'=QBB{len(props_bytes)}sI{len(msg_bytes)}s',
-            self.timestamp,
-            self.level,
-            len(self.properties),
-            props_bytes,
-            len(msg_bytes),
-            msg_bytes
-        )
+        buf += _MSG_LEN.pack(len(msg_bytes))
+        buf += msg_bytes
     
     @classmethod
     def unpack(cls, data: bytes) -> 'LogEntry':
-        offset = 0
-        
+        return cls.unpack_from(data)[0]
+
+    @classmethod
+    def unpack_from(cls, data: bytes, offset: int = 0) -> tuple['LogEntry', int]:
         # Unpack fixed-length header
-        timestamp, level, props_count = struct.unpack_from('=QBB', data, offset)
-        offset += struct.calcsize('=QBB')
+        timestamp, level, props_count = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
         
         # Unpack properties
         properties = []
@@ -88,9 +110,28 @@ class LogEntry:
             offset = new_offset
         
         # Unpack message length and message
-        msg_len = struct.unpack_from('=I', data, offset)[0]
-        offset += struct.calcsize('=I')
+        msg_len = _MSG_LEN.unpack_from(data, offset)[0]
+        offset += _MSG_LEN.size
         
-        message = struct.unpack_from(f'{msg_len}s', data, offset)[0].decode('utf-8')
+        message = _read_str(data, offset, msg_len)
+        offset += msg_len
         
-        return cls(timestamp, level, properties, message)
\ No newline at end of file
+        return cls(timestamp, level, properties, message), offset
+
+def pack_entries(entries: List[LogEntry]) -> bytes:
+    buf = bytearray()
+    for entry in entries:
+        entry.pack_into(buf)
+    return bytes(buf)
+
+def unpack_entries(data: bytes) -> List[LogEntry]:
+    # Walk the buffer by offset instead of slicing out each entry
+    entries = []
+    offset = 0
+    while offset < len(data):
+        try:
+            entry, offset = LogEntry.unpack_from(data, offset)
+        except struct.error as e:
+            raise struct.error(f'truncated entry at offset {offset}: {e}') from e
+        entries.append(entry)
+    return entries
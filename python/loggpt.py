@@ -1,6 +1,8 @@
 import math
 import numpy as np
-from tinygrad import Tensor, nn
+from tinygrad import Tensor, dtypes, nn
+from tinygrad.dtype import DType
+from tinygrad.nn.state import get_parameters
 from dataclasses import dataclass
 
 @dataclass
@@ -11,14 +13,29 @@ class GPTConfig:
 	n_head: int = 8
 	embed_dim: int = 128
 
+# Causal masks keyed by block size, shared by every attention layer
+_CAUSAL_MASK_CACHE: dict[int, Tensor] = {}
+
+def causal_mask(block_size: int) -> Tensor:
+	mask = _CAUSAL_MASK_CACHE.get(block_size)
+	if mask is None:
+		mask = Tensor.ones(1, 1, block_size, block_size, dtype=dtypes.bool).tril()
+		mask.requires_grad = False
+		_CAUSAL_MASK_CACHE[block_size] = mask
+	return mask
+
+def masked_softmax(x: Tensor, mask: Tensor) -> Tensor:
+	# Additive bias instead of masked_fill keeps the whole expression
+	# elementwise, so tinygrad fuses it into the softmax reductions
+	return (x + mask.where(0.0, -1e9)).softmax()
+
 class CasualSelfAttention:
 	def __init__(self, config: GPTConfig):
 		self.attention = nn.Linear(config.embed_dim, config.embed_dim * 3)
 		self.proj = nn.Linear(config.embed_dim, config.embed_dim)
 		self.heads = config.n_head
 		self.embed_dim = config.embed_dim
-		self.bias = Tensor.ones(1, 1, config.block_size, config.block_size).tril()
-		self.bias.requires_grad = False
+		self.bias = causal_mask(config.block_size)
 	def __call__(self, x: Tensor) -> Tensor:
 		B, T, C = x.shape
 		qkv = self.attention(x)
@@ -28,8 +45,8 @@ class CasualSelfAttention:
 		v = v.view(B, T, self.heads, C // self.heads).transpose(1, 2)
 
 		attention = (q @ k.transpose(-2, -1)) * (1.0 / math.sqrt(k.size(-1)))
-		attention = attention.masked_fill(self.bias[:, :, :T, :T] == 0, float('-inf'))
-		attention = attention.softmax()
+		# Softmax is accumulated in float32 even when the model runs in half precision
+		attention = masked_softmax(attention.float(), self.bias[:, :, :T, :T]).cast(v.dtype)
 		y = attention @ v
 		y = y.transpose(1, 2).view(B, T, C)
 		y = self.proj(y)
@@ -62,6 +79,8 @@ class LogGPT:
 		self.blocks = [TransformerBlock(config) for _ in range(config.n_layer)]
 		self.norm = nn.LayerNorm(config.embed_dim)
 		self.head = nn.Linear(config.embed_dim, config.vocab_size)
+		# Tie the output projection to the token embedding
+		self.head.weight = self.token_embedding.weight
 
 	def __call__(self, inx: Tensor, targets = None) -> Tensor:
 		b, t = inx.shape
@@ -74,9 +93,21 @@ class LogGPT:
 
 		if targets is not None:
 			logits = self.head(x)[:, -1, :self.config.vocab_size]
-			loss = logits.sparse_categorical_crossentropy(targets)
+			loss = logits.float().sparse_categorical_crossentropy(targets)
 		else:
 			logits = self.head(x[:, [-1], :])[:, :, :self.config.vocab_size]
 			loss = None
 
 		return logits, loss
+
+def unique_parameters(model) -> list[Tensor]:
+	# Tied weights and the shared causal mask are reachable from several
+	# layers and get_parameters returns them once per reference. Casting
+	# needs each tensor once; the optimizer already de-duplicates on its own
+	return list({id(param): param for param in get_parameters(model)}.values())
+
+def cast_parameters(model, dtype: DType):
+	# Casts in place so the layers keep referencing the same tensors
+	for param in unique_parameters(model):
+		if dtypes.is_float(param.dtype):
+			param.replace(param.cast(dtype).realize())